@@ -1,15 +1,19 @@
 import json
 import os
+import tempfile
 import threading
-import webbrowser
-from dataclasses import dataclass, asdict
+import time
+import uuid
+from dataclasses import dataclass, field, fields as dataclass_fields
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 
-import requests
 from kivy.app import App
 from kivy.clock import Clock
+from kivy.graphics import Color, RoundedRectangle
 from kivy.lang import Builder
 from kivy.properties import BooleanProperty, ListProperty, ObjectProperty, StringProperty
 from kivy.uix.boxlayout import BoxLayout
@@ -19,10 +23,78 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.image import AsyncImage
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.spinner import Spinner
 from kivy.uix.textinput import TextInput
 
+try:
+    import ijson
+
+    # The pure-Python backend is many times slower than a whole-buffer parse; only stream with a C one.
+    if ijson.backend not in ("yajl2_c", "yajl2_cffi"):
+        ijson = None
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _dumps_line(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload) + b"\n"
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _starts_with_array(fh) -> bool:
+    while True:
+        chunk = fh.read(256)
+        if not chunk:
+            return False
+        chunk = chunk.lstrip()
+        if chunk:
+            fh.seek(0)
+            return chunk.startswith(b"[")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+_NOW_CACHE = [0.0, ""]
+
+
+def _now_iso() -> str:
+    # Bulk imports construct many movies per second; reuse one timestamp per second.
+    now = time.time()
+    if int(now) != int(_NOW_CACHE[0]):
+        _NOW_CACHE[:] = [now, datetime.utcfromtimestamp(now).isoformat()]
+    return _NOW_CACHE[1]
+
+
 KV = """
 <RootView>:
     orientation: "vertical"
@@ -67,7 +139,7 @@ KV = """
             id: search_input
             hint_text: "Search movies..."
             multiline: False
-            on_text: app.refresh_movies()
+            on_text: app.schedule_refresh()
 
         Spinner:
             id: filter_spinner
@@ -104,19 +176,30 @@ KV = """
             color: app.theme_button_text
             on_release: app.open_api_key_popup()
 
-    ScrollView:
-        id: movie_scroll
+    Label:
+        text: "" if movie_rv.data else "No movies found. Add your first movie."
+        color: app.theme_text
+        size_hint_y: None
+        height: 0 if movie_rv.data else dp(40)
+        opacity: 0 if movie_rv.data else 1
+
+    RecycleView:
+        id: movie_rv
+        viewclass: "MovieCard"
         do_scroll_x: False
 
-        GridLayout:
-            id: movie_grid
-            cols: 1
-            spacing: dp(10)
-            padding: [0, 0, 0, dp(10)]
+        RecycleBoxLayout:
+            orientation: "vertical"
+            default_size_hint: 1, None
+            default_size: None, 310
             size_hint_y: None
             height: self.minimum_height
+            spacing: dp(10)
+            padding: [0, 0, 0, dp(10)]
 """
 
+Builder.load_string(KV)
+
 
 @dataclass
 class Movie:
@@ -131,16 +214,33 @@ class Movie:
     local_file: str = ""
     notes: str = ""
     created_at: str = ""
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    _title_lc: str = field(default="", init=False, repr=False, compare=False)
+    _haystack: str = field(default="", init=False, repr=False, compare=False)
+    _year_int: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.created_at:
-            self.created_at = datetime.utcnow().isoformat()
+            self.created_at = _now_iso()
+        self.update_cached_fields()
+
+    def update_cached_fields(self) -> None:
+        self._title_lc = self.title.lower()
+        # One lowercase string per movie so search is a single substring check;
+        # the unit separator keeps matches from spanning title and notes.
+        self._haystack = f"{self.title}\x1f{self.notes}".lower()
+        self._year_int = int(self.year[:4]) if self.year[:4].isdecimal() else 0
+
+    def to_dict(self) -> dict:
+        return dict(zip(_PERSISTED_FIELDS, _PERSISTED_VALUES(self)))
 
     @classmethod
-    def from_dict(cls, payload: dict) -> "Movie":
+    def from_dict(cls, payload: dict, intern: Optional[Callable[[str], str]] = None) -> "Movie":
+        if intern is None:
+            intern = str
         return cls(
             title=str(payload.get("title", "")).strip(),
-            year=str(payload.get("year", "")).strip(),
+            year=intern(str(payload.get("year", "")).strip()),
             rating=float(payload.get("rating", 0) or 0),
             poster_url=str(payload.get("poster_url", "")).strip(),
             watched=bool(payload.get("watched", False)),
@@ -148,15 +248,107 @@ class Movie:
             watchlist=bool(payload.get("watchlist", True)),
             trailer_url=str(payload.get("trailer_url", "")).strip(),
             local_file=str(payload.get("local_file", "")).strip(),
-            notes=str(payload.get("notes", "")).strip(),
+            notes=intern(str(payload.get("notes", "")).strip()),
             created_at=str(payload.get("created_at", "")).strip(),
+            id=str(payload.get("id", "")).strip() or uuid.uuid4().hex,
         )
 
 
+_PERSISTED_FIELDS = tuple(f.name for f in dataclass_fields(Movie) if not f.name.startswith("_"))
+_PERSISTED_VALUES = attrgetter(*_PERSISTED_FIELDS)
+
+_TITLE_KEY = attrgetter("_title_lc")
+_YEAR_KEY = attrgetter("_year_int")
+_RATING_KEY = attrgetter("rating")
+
+
 class RootView(BoxLayout):
     pass
 
 
+class MovieCard(RecycleDataViewBehavior, BoxLayout):
+    def __init__(self, **kwargs):
+        super().__init__(orientation="vertical", spacing=8, padding=8, **kwargs)
+        self.index = 0
+        self.movie: Optional[Movie] = None
+        app = App.get_running_app()
+
+        with self.canvas.before:
+            self.bg_color = Color(*app.theme_card)
+            self.bg = RoundedRectangle(pos=self.pos, size=self.size, radius=[12])
+
+        top = BoxLayout(size_hint_y=None, height=180, spacing=8)
+        self.poster = AsyncImage(source="", allow_stretch=True)
+        self.poster.size_hint_x = None
+        self.poster.width = 120
+        top.add_widget(self.poster)
+
+        info = BoxLayout(orientation="vertical", spacing=6)
+        self.title_label = Label(markup=True, halign="left", text_size=(0, None))
+        self.year_label = Label(halign="left", text_size=(0, None))
+        self.rating_label = Label(halign="left", text_size=(0, None))
+        self.watched_label = Label(halign="left", text_size=(0, None))
+        self.favorite_label = Label(halign="left", text_size=(0, None))
+        self.labels = [self.title_label, self.year_label, self.rating_label, self.watched_label, self.favorite_label]
+        for label in self.labels:
+            info.add_widget(label)
+        top.add_widget(info)
+        self.add_widget(top)
+
+        self.buttons: List[Button] = []
+        actions = GridLayout(cols=3, size_hint_y=None, height=40, spacing=6)
+        actions.add_widget(self._btn("Edit", app.open_movie_form))
+        actions.add_widget(self._btn("Delete", app.delete_movie))
+        actions.add_widget(self._btn("Trailer", app.open_trailer))
+        self.add_widget(actions)
+
+        actions2 = GridLayout(cols=3, size_hint_y=None, height=40, spacing=6)
+        actions2.add_widget(self._btn("Play File", app.play_local))
+        actions2.add_widget(self._btn("Watched", partial(app.toggle_flag, field="watched")))
+        actions2.add_widget(self._btn("Favorite", partial(app.toggle_flag, field="favorite")))
+        self.add_widget(actions2)
+
+    def on_pos(self, _instance, value):
+        self.bg.pos = value
+
+    def on_size(self, _instance, value):
+        self.bg.size = value
+
+    def _btn(self, text: str, action):
+        btn = Button(text=text, background_normal="")
+        btn.bind(on_release=partial(self._on_action, action))
+        self.buttons.append(btn)
+        return btn
+
+    def _on_action(self, action, *_):
+        action(self.movie)
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.index = index
+        self.movie = data["movie"]
+        app = App.get_running_app()
+
+        self.bg_color.rgba = app.theme_card
+        if data["poster_url"]:
+            self.poster.source = data["poster_url"]
+            self.poster.opacity = 1
+            self.poster.width = 120
+        else:
+            self.poster.source = ""
+            self.poster.opacity = 0
+            self.poster.width = 0
+        self.title_label.text = f"[b]{data['title']}[/b]"
+        self.year_label.text = f"Year: {data['year'] or '-'}"
+        self.rating_label.text = f"Rating: {data['rating']:.1f}"
+        self.watched_label.text = f"Watched: {'Yes' if data['watched'] else 'No'}"
+        self.favorite_label.text = f"Favorite: {'Yes' if data['favorite'] else 'No'}"
+        for label in self.labels:
+            label.color = app.theme_text
+        for btn in self.buttons:
+            btn.background_color = app.theme_button
+            btn.color = app.theme_button_text
+
+
 class MovieManagerApp(App):
     dark_mode = BooleanProperty(True)
     theme_bg = ListProperty([0.08, 0.09, 0.11, 1])
@@ -166,42 +358,196 @@ class MovieManagerApp(App):
     theme_button = ListProperty([0.22, 0.24, 0.31, 1])
     theme_button_text = ListProperty([1, 1, 1, 1])
     data_file = StringProperty("")
+    journal_file = StringProperty("")
     settings_file = StringProperty("")
+    tmdb_cache_file = StringProperty("")
     root_view = ObjectProperty(None)
 
     def build(self):
-        Builder.load_string(KV)
         self.title = "Offline Movie Manager"
         self.data_file = os.path.join(self.user_data_dir, "movies.json")
+        self.journal_file = os.path.join(self.user_data_dir, "movies.journal.jsonl")
         self.settings_file = os.path.join(self.user_data_dir, "settings.json")
+        self.tmdb_cache_file = os.path.join(self.user_data_dir, "tmdb_cache.json")
 
         self.movies: List[Movie] = []
+        self._movies_version = 0
+        self._refresh_ev = None
+        self._refresh_trigger = Clock.create_trigger(lambda *_: self.refresh_movies(), 0)
+        self._journal_dirty = False
+        self._load_failed = False
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_snapshot: Optional[List[tuple]] = None
+        self._pending_journal: List[bytes] = []
+        self._save_event = threading.Event()
+        threading.Thread(target=self._writer_loop, daemon=True).start()
         self.tmdb_api_key = os.environ.get("TMDB_API_KEY", "").strip()
 
+        self._http = None
+        self._http_lock = threading.Lock()
+
+        self._tmdb_cache_lock = threading.Lock()
+        self._tmdb_cache: Dict[str, dict] = self._load_tmdb_cache()
+
         self._load_settings()
         self._apply_theme()
         self.movies = self._load_movies()
+        self._by_id: Dict[str, Movie] = {m.id: m for m in self.movies}
+        self._compact()
 
         self.root_view = RootView()
-        Clock.schedule_once(lambda *_: self.refresh_movies(), 0)
+        self._refresh_trigger()
+        Clock.schedule_interval(self._compact, 30)
         return self.root_view
 
+    def on_pause(self):
+        self._compact()
+        self._flush_pending()
+        return True
+
+    def on_stop(self):
+        self._compact()
+        self._flush_pending()
+
     def _load_movies(self) -> List[Movie]:
         if not os.path.exists(self.data_file):
             return []
+        pool: Dict[str, str] = {}
+
+        def intern(value: str) -> str:
+            return pool.setdefault(value, value)
+
+        needs_backfill = False
+        seen_ids = set()
         try:
-            with open(self.data_file, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-            if not isinstance(data, list):
-                return []
-            return [Movie.from_dict(item) for item in data if isinstance(item, dict)]
+            with open(self.data_file, "rb") as fh:
+                if ijson is not None and orjson is None:
+                    if not _starts_with_array(fh):
+                        self._load_failed = True
+                        return []
+                    data = ijson.items(fh, "item", use_float=True)
+                else:
+                    data = _loads(fh.read())
+                    if not isinstance(data, list):
+                        self._load_failed = True
+                        return []
+                movies = []
+                for item in data:
+                    if not isinstance(item, dict):
+                        continue
+                    movie = Movie.from_dict(item, intern=intern)
+                    if not item.get("id"):
+                        needs_backfill = True
+                    elif movie.id in seen_ids:
+                        # Duplicate ids would collapse in the id-keyed dicts; give the copy a fresh one.
+                        movie.id = uuid.uuid4().hex
+                        needs_backfill = True
+                    seen_ids.add(movie.id)
+                    movies.append(movie)
         except Exception:
+            # Leave the unreadable file and its journal alone; compacting would overwrite them with [].
+            self._load_failed = True
             return []
+        if needs_backfill:
+            # Persist generated or replaced ids on the next compaction.
+            self._journal_dirty = True
+        return self._replay_journal(movies)
+
+    def _replay_journal(self, movies: List[Movie]) -> List[Movie]:
+        if not os.path.exists(self.journal_file):
+            return movies
+        try:
+            with open(self.journal_file, "rb") as fh:
+                lines = fh.readlines()
+        except OSError:
+            return movies
+
+        by_id = {m.id: m for m in movies}
+        for line in lines:
+            try:
+                entry = _loads(line)
+            except ValueError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            movie = by_id.get(entry.get("id"))
+            if movie is None:
+                continue
+            if entry.get("op") == "set":
+                for field in ("watched", "favorite", "watchlist"):
+                    if field in entry:
+                        setattr(movie, field, bool(entry[field]))
+            elif entry.get("op") == "delete":
+                del by_id[movie.id]
+            self._journal_dirty = True
+        return list(by_id.values())
+
+    def _append_journal(self, op: str, movie_id: str, **fields) -> None:
+        line = _dumps_line({"op": op, "id": movie_id, **fields})
+        with self._pending_lock:
+            self._pending_journal.append(line)
+        self._journal_dirty = True
+        self._save_event.set()
+
+    def _compact(self, *_) -> None:
+        if self._journal_dirty and not self._load_failed:
+            self._save_movies()
 
     def _save_movies(self) -> None:
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        with open(self.data_file, "w", encoding="utf-8") as fh:
-            json.dump([asdict(m) for m in self.movies], fh, indent=2)
+        if self._load_failed:
+            self._set_aside_unreadable()
+        # Only read the field values here; building dicts and serialising is left to the writer thread.
+        snapshot = [_PERSISTED_VALUES(m) for m in self.movies]
+        with self._pending_lock:
+            # The snapshot already reflects every queued journal entry.
+            self._pending_snapshot = snapshot
+            self._pending_journal = []
+        self._journal_dirty = False
+        self._save_event.set()
+
+    def _set_aside_unreadable(self) -> None:
+        # Keep the file that failed to load, and its journal, instead of saving over them.
+        for path in (self.data_file, self.journal_file):
+            if os.path.exists(path):
+                os.replace(path, path + ".unreadable")
+        self._load_failed = False
+
+    def _writer_loop(self) -> None:
+        while True:
+            self._save_event.wait()
+            self._save_event.clear()
+            time.sleep(0.2)
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        with self._write_lock:
+            with self._pending_lock:
+                snapshot, self._pending_snapshot = self._pending_snapshot, None
+                journal, self._pending_journal = self._pending_journal, []
+            try:
+                if snapshot is not None:
+                    self._write_snapshot(_dumps([dict(zip(_PERSISTED_FIELDS, values)) for values in snapshot]))
+                    snapshot = None
+                if journal:
+                    os.makedirs(os.path.dirname(self.journal_file), exist_ok=True)
+                    with open(self.journal_file, "ab") as fh:
+                        fh.write(b"".join(journal))
+            except OSError:
+                self._requeue_pending(snapshot, journal)
+
+    def _requeue_pending(self, snapshot: Optional[List[tuple]], journal: List[bytes]) -> None:
+        with self._pending_lock:
+            # A snapshot queued since the failure already covers everything that was taken.
+            if self._pending_snapshot is None:
+                self._pending_snapshot = snapshot
+                self._pending_journal = journal + self._pending_journal
+        self._journal_dirty = True
+
+    def _write_snapshot(self, snapshot: bytes) -> None:
+        _write_atomic(self.data_file, snapshot)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
 
     def _load_settings(self) -> None:
         if not os.path.exists(self.settings_file):
@@ -227,6 +573,39 @@ class MovieManagerApp(App):
                 indent=2,
             )
 
+    def _http_session(self):
+        with self._http_lock:
+            if self._http is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                self._http = requests.Session()
+                self._http.headers["Accept"] = "application/json"
+                retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+                self._http.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+            return self._http
+
+    def _load_tmdb_cache(self) -> Dict[str, dict]:
+        if not os.path.exists(self.tmdb_cache_file):
+            return {}
+        try:
+            with open(self.tmdb_cache_file, "rb") as fh:
+                data = _loads(fh.read())
+            if not isinstance(data, dict):
+                return {}
+            return {key: value for key, value in data.items() if isinstance(value, dict)}
+        except Exception:
+            return {}
+
+    def _store_tmdb_match(self, key: str, match: dict) -> None:
+        with self._tmdb_cache_lock:
+            self._tmdb_cache[key] = match
+            try:
+                _write_atomic(self.tmdb_cache_file, _dumps(self._tmdb_cache))
+            except OSError:
+                return
+
     def _apply_theme(self) -> None:
         if self.dark_mode:
             self.theme_bg = [0.08, 0.09, 0.11, 1]
@@ -245,7 +624,8 @@ class MovieManagerApp(App):
         self.dark_mode = not self.dark_mode
         self._apply_theme()
         self._save_settings()
-        self.refresh_movies()
+        if self.root_view:
+            self.root_view.ids.movie_rv.refresh_from_data()
 
     def open_api_key_popup(self) -> None:
         content = BoxLayout(orientation="vertical", spacing=8, padding=10)
@@ -274,10 +654,14 @@ class MovieManagerApp(App):
         search = self.root_view.ids.search_input.text.strip().lower()
         filter_value = self.root_view.ids.filter_spinner.text
         sort_value = self.root_view.ids.sort_spinner.text
+        return list(self._filtered_movies_cached(search, filter_value, sort_value, self._movies_version))
 
-        items = self.movies
+    @lru_cache(maxsize=8)
+    def _filtered_movies_cached(self, search: str, filter_value: str, sort_value: str, version: int) -> Tuple[Movie, ...]:
+        movies = self.movies
+        items = movies
         if search:
-            items = [m for m in items if search in m.title.lower() or search in m.notes.lower()]
+            items = [m for m in items if search in m._haystack]
 
         if filter_value == "Watched":
             items = [m for m in items if m.watched]
@@ -286,101 +670,66 @@ class MovieManagerApp(App):
         elif filter_value == "Watchlist":
             items = [m for m in items if m.watchlist]
 
+        if items is movies:
+            items = movies.copy()
         if sort_value == "Title":
-            items = sorted(items, key=lambda m: m.title.lower())
+            items.sort(key=_TITLE_KEY)
         elif sort_value == "Year":
-            items = sorted(items, key=lambda m: m.year or "0", reverse=True)
+            items.sort(key=_YEAR_KEY, reverse=True)
         elif sort_value == "Rating":
-            items = sorted(items, key=lambda m: m.rating, reverse=True)
+            items.sort(key=_RATING_KEY, reverse=True)
 
-        return items
+        return tuple(items)
+
+    def schedule_refresh(self) -> None:
+        if self._refresh_ev:
+            self._refresh_ev.cancel()
+        self._refresh_ev = Clock.schedule_once(lambda *_: self.refresh_movies(), 0.15)
 
     def refresh_movies(self) -> None:
         if not self.root_view:
             return
-        grid = self.root_view.ids.movie_grid
-        grid.clear_widgets()
-
-        filtered = self._filtered_movies()
-        if not filtered:
-            empty = Label(
-                text="No movies found. Add your first movie.",
-                color=self.theme_text,
-                size_hint_y=None,
-                height=40,
-            )
-            grid.add_widget(empty)
-            return
-
-        for movie in filtered:
-            grid.add_widget(self._build_movie_card(movie))
-
-    def _build_movie_card(self, movie: Movie) -> BoxLayout:
-        card = BoxLayout(orientation="vertical", spacing=8, padding=8, size_hint_y=None, height=310)
-        with card.canvas.before:
-            from kivy.graphics import Color, RoundedRectangle
-
-            Color(*self.theme_card)
-            card.bg = RoundedRectangle(pos=card.pos, size=card.size, radius=[12])
-
-        def update_bg(instance, _value):
-            instance.bg.pos = instance.pos
-            instance.bg.size = instance.size
-
-        card.bind(pos=update_bg, size=update_bg)
-
-        top = BoxLayout(size_hint_y=None, height=180, spacing=8)
-        poster = AsyncImage(source=movie.poster_url or "", allow_stretch=True)
-        poster.size_hint_x = None
-        poster.width = 120
-        top.add_widget(poster)
-
-        info = BoxLayout(orientation="vertical", spacing=6)
-        info.add_widget(Label(text=f"[b]{movie.title}[/b]", markup=True, color=self.theme_text, halign="left", text_size=(0, None)))
-        info.add_widget(Label(text=f"Year: {movie.year or '-'}", color=self.theme_text, halign="left", text_size=(0, None)))
-        info.add_widget(Label(text=f"Rating: {movie.rating:.1f}", color=self.theme_text, halign="left", text_size=(0, None)))
-        info.add_widget(Label(text=f"Watched: {'Yes' if movie.watched else 'No'}", color=self.theme_text, halign="left", text_size=(0, None)))
-        info.add_widget(Label(text=f"Favorite: {'Yes' if movie.favorite else 'No'}", color=self.theme_text, halign="left", text_size=(0, None)))
-        top.add_widget(info)
-        card.add_widget(top)
-
-        actions = GridLayout(cols=3, size_hint_y=None, height=40, spacing=6)
-        actions.add_widget(self._btn("Edit", lambda *_: self.open_movie_form(movie)))
-        actions.add_widget(self._btn("Delete", lambda *_: self.delete_movie(movie)))
-        actions.add_widget(self._btn("Trailer", lambda *_: self.open_trailer(movie)))
-        card.add_widget(actions)
-
-        actions2 = GridLayout(cols=3, size_hint_y=None, height=40, spacing=6)
-        actions2.add_widget(self._btn("Play File", lambda *_: self.play_local(movie)))
-        actions2.add_widget(self._btn("Watched", lambda *_: self.toggle_flag(movie, "watched")))
-        actions2.add_widget(self._btn("Favorite", lambda *_: self.toggle_flag(movie, "favorite")))
-        card.add_widget(actions2)
-
-        return card
-
-    def _btn(self, text: str, on_press):
-        btn = Button(text=text, background_normal="", background_color=self.theme_button, color=self.theme_button_text)
-        btn.bind(on_release=on_press)
-        return btn
+        self.root_view.ids.movie_rv.data = [
+            {
+                "movie": m,
+                "title": m.title,
+                "year": m.year,
+                "rating": m.rating,
+                "poster_url": m.poster_url,
+                "watched": m.watched,
+                "favorite": m.favorite,
+            }
+            for m in self._filtered_movies()
+        ]
 
     def toggle_flag(self, movie: Movie, field: str) -> None:
         setattr(movie, field, not getattr(movie, field))
         if field == "watched" and movie.watched:
             movie.watchlist = False
-        self._save_movies()
-        self.refresh_movies()
+        self._movies_version += 1
+        self._append_journal(
+            "set",
+            movie.id,
+            watched=movie.watched,
+            favorite=movie.favorite,
+            watchlist=movie.watchlist,
+        )
+        self._refresh_trigger()
 
     def delete_movie(self, movie: Movie) -> None:
-        if movie in self.movies:
-            self.movies.remove(movie)
-            self._save_movies()
-            self.refresh_movies()
+        if self._by_id.pop(movie.id, None) is not None:
+            self.movies = list(self._by_id.values())
+            self._movies_version += 1
+            self._append_journal("delete", movie.id)
+            self._refresh_trigger()
 
     def open_trailer(self, movie: Movie) -> None:
         url = movie.trailer_url.strip()
         if not url:
             query = quote_plus(f"{movie.title} official trailer")
             url = f"https://www.youtube.com/results?search_query={query}"
+        import webbrowser
+
         webbrowser.open(url)
 
     def play_local(self, movie: Movie) -> None:
@@ -388,6 +737,8 @@ class MovieManagerApp(App):
         if not path:
             return
         if os.path.exists(path):
+            import webbrowser
+
             try:
                 from kivy.utils import platform
 
@@ -460,6 +811,23 @@ class MovieManagerApp(App):
             if not title:
                 status.text = "Enter a title first."
                 return
+
+            def apply(match: dict) -> None:
+                movie_rating = float(match.get("rating") or 0)
+                fields["year"].text = match.get("year") or fields["year"].text
+                fields["rating"].text = f"{movie_rating:.1f}" if movie_rating else fields["rating"].text
+                fields["poster_url"].text = match.get("poster_url") or fields["poster_url"].text
+                if not fields["trailer_url"].text.strip():
+                    query = quote_plus(f"{title} official trailer")
+                    fields["trailer_url"].text = f"https://www.youtube.com/results?search_query={query}"
+                status.text = "TMDB data fetched."
+
+            key = f"{title.lower()}|{year}"
+            cached = self._tmdb_cache.get(key)
+            if cached is not None:
+                apply(cached)
+                return
+
             if not self.tmdb_api_key:
                 status.text = "Set TMDB API key first."
                 return
@@ -468,32 +836,25 @@ class MovieManagerApp(App):
 
             def worker():
                 try:
-                    params = {"api_key": self.tmdb_api_key, "query": title}
+                    params = {"api_key": self.tmdb_api_key, "query": title, "page": 1}
                     if year:
                         params["primary_release_year"] = year
-                    resp = requests.get("https://api.themoviedb.org/3/search/movie", params=params, timeout=12)
+                    resp = self._http_session().get("https://api.themoviedb.org/3/search/movie", params=params, timeout=12)
                     resp.raise_for_status()
-                    results = resp.json().get("results", [])
+                    results = _loads(resp.content).get("results", [])
                     if not results:
                         Clock.schedule_once(lambda *_: setattr(status, "text", "No TMDB match found."), 0)
                         return
                     best = results[0]
                     poster_path = best.get("poster_path") or ""
-                    poster_url = f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else ""
                     release_date = str(best.get("release_date", ""))
-                    movie_year = release_date[:4] if release_date else ""
-                    movie_rating = float(best.get("vote_average") or 0)
-
-                    def apply():
-                        fields["year"].text = movie_year or fields["year"].text
-                        fields["rating"].text = f"{movie_rating:.1f}" if movie_rating else fields["rating"].text
-                        fields["poster_url"].text = poster_url or fields["poster_url"].text
-                        if not fields["trailer_url"].text.strip():
-                            query = quote_plus(f"{title} official trailer")
-                            fields["trailer_url"].text = f"https://www.youtube.com/results?search_query={query}"
-                        status.text = "TMDB data fetched."
-
-                    Clock.schedule_once(lambda *_: apply(), 0)
+                    match = {
+                        "poster_url": f"https://image.tmdb.org/t/p/w500{poster_path}" if poster_path else "",
+                        "year": release_date[:4] if release_date else "",
+                        "rating": float(best.get("vote_average") or 0),
+                    }
+                    Clock.schedule_once(lambda *_: apply(match), 0)
+                    self._store_tmdb_match(key, match)
                 except Exception as exc:
                     Clock.schedule_once(lambda *_: setattr(status, "text", f"TMDB error: {exc}"), 0)
 
@@ -521,15 +882,18 @@ class MovieManagerApp(App):
             target.trailer_url = fields["trailer_url"].text.strip()
             target.local_file = fields["local_file"].text.strip()
             target.notes = fields["notes"].text.strip()
+            target.update_cached_fields()
             target.watched = watched.active
             target.favorite = favorite.active
             target.watchlist = watchlist.active
 
             if not editing:
                 self.movies.append(target)
+                self._by_id[target.id] = target
 
+            self._movies_version += 1
             self._save_movies()
-            self.refresh_movies()
+            self._refresh_trigger()
             popup.dismiss()
 
         def clear(*_):